@@ -1,5 +1,22 @@
 """A1Z26 encoding module (A=1, B=2, ..., Z=26)."""
 
+import functools
+
+# Precomputed codes indexed by ord(char): "1"-"26" for ASCII letters of
+# either case, "" for everything else.
+_A1Z26: list[str] = [""] * 128
+for _i, _c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZ", start=1):
+    _A1Z26[ord(_c)] = str(_i)
+    _A1Z26[ord(_c) + 32] = str(_i)
+del _i, _c
+
+# Translation table for encode_word: letters map to their code plus the
+# separator, every other ASCII character maps to "" so translate() also
+# performs the filtering in a single C-level pass.
+_A1Z26_TRANS: dict[int, str] = {
+    o: f"{code} " if code else "" for o, code in enumerate(_A1Z26)
+}
+
 
 def encode_char(char: str) -> str:
     """Encode a single character to A1Z26.
@@ -10,12 +27,12 @@ def encode_char(char: str) -> str:
     Returns:
         The number representation (1-26) or empty string for invalid chars.
     """
-    upper = char.upper()
-    if not upper.isalpha() or len(upper) != 1:
+    if len(char) != 1 or ord(char) >= 128:
         return ""
-    return str(ord(upper) - ord("A") + 1)
+    return _A1Z26[ord(char)]
 
 
+@functools.lru_cache(maxsize=256)
 def encode_word(word: str) -> str:
     """Encode a word to A1Z26.
 
@@ -25,10 +42,12 @@ def encode_word(word: str) -> str:
     Returns:
         The A1Z26 representation with dashes between numbers.
     """
-    numbers = [encode_char(c) for c in word if c.isalpha()]
-    return " ".join(numbers)
+    if word.isascii():
+        return word.translate(_A1Z26_TRANS).rstrip(" ")
+    return " ".join(_A1Z26[o] for c in word if (o := ord(c)) < 128 and _A1Z26[o])
 
 
+@functools.lru_cache(maxsize=256)
 def get_display_lines(word: str) -> list[str]:
     """Get the display lines for a word in A1Z26.
 
@@ -37,5 +56,6 @@ def get_display_lines(word: str) -> list[str]:
 
     Returns:
         A list containing a single line with the A1Z26 encoding.
+        The list is cached across calls; callers must not mutate it.
     """
     return [encode_word(word)]
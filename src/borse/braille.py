@@ -1,38 +1,40 @@
 """Braille encoding module with ASCII art display."""
 
+import functools
+
 # Braille patterns for letters a-z
 # Dots are numbered:
 # 1 4
 # 2 5
 # 3 6
 # We store which dots are raised for each letter
-BRAILLE_PATTERNS: dict[str, tuple[int, ...]] = {
-    "A": (1,),
-    "B": (1, 2),
-    "C": (1, 4),
-    "D": (1, 4, 5),
-    "E": (1, 5),
-    "F": (1, 2, 4),
-    "G": (1, 2, 4, 5),
-    "H": (1, 2, 5),
-    "I": (2, 4),
-    "J": (2, 4, 5),
-    "K": (1, 3),
-    "L": (1, 2, 3),
-    "M": (1, 3, 4),
-    "N": (1, 3, 4, 5),
-    "O": (1, 3, 5),
-    "P": (1, 2, 3, 4),
-    "Q": (1, 2, 3, 4, 5),
-    "R": (1, 2, 3, 5),
-    "S": (2, 3, 4),
-    "T": (2, 3, 4, 5),
-    "U": (1, 3, 6),
-    "V": (1, 2, 3, 6),
-    "W": (2, 4, 5, 6),
-    "X": (1, 3, 4, 6),
-    "Y": (1, 3, 4, 5, 6),
-    "Z": (1, 3, 5, 6),
+BRAILLE_PATTERNS: dict[str, frozenset[int]] = {
+    "A": frozenset({1}),
+    "B": frozenset({1, 2}),
+    "C": frozenset({1, 4}),
+    "D": frozenset({1, 4, 5}),
+    "E": frozenset({1, 5}),
+    "F": frozenset({1, 2, 4}),
+    "G": frozenset({1, 2, 4, 5}),
+    "H": frozenset({1, 2, 5}),
+    "I": frozenset({2, 4}),
+    "J": frozenset({2, 4, 5}),
+    "K": frozenset({1, 3}),
+    "L": frozenset({1, 2, 3}),
+    "M": frozenset({1, 3, 4}),
+    "N": frozenset({1, 3, 4, 5}),
+    "O": frozenset({1, 3, 5}),
+    "P": frozenset({1, 2, 3, 4}),
+    "Q": frozenset({1, 2, 3, 4, 5}),
+    "R": frozenset({1, 2, 3, 5}),
+    "S": frozenset({2, 3, 4}),
+    "T": frozenset({2, 3, 4, 5}),
+    "U": frozenset({1, 3, 6}),
+    "V": frozenset({1, 2, 3, 6}),
+    "W": frozenset({2, 4, 5, 6}),
+    "X": frozenset({1, 3, 4, 6}),
+    "Y": frozenset({1, 3, 4, 5, 6}),
+    "Z": frozenset({1, 3, 5, 6}),
 }
 
 # Grade 2: strong group-sign contractions (can appear anywhere within a word,
@@ -217,7 +219,7 @@ _SORTED_CONTRACTIONS: list[tuple[str, tuple[int, ...], bool]] = sorted(
 )
 
 
-def _apply_grade2(word: str) -> list[tuple[str, tuple[int, ...]]]:
+def _apply_grade2(word: str) -> list[tuple[str, frozenset[int] | tuple[int, ...]]]:
     """Decompose *word* into Grade 2 Braille cells.
 
     Returns a list of (label, dots) pairs where *label* is the original
@@ -230,7 +232,7 @@ def _apply_grade2(word: str) -> list[tuple[str, tuple[int, ...]]]:
     """
     w = word.upper()
     breaks = _get_syllable_breaks(word)
-    result: list[tuple[str, tuple[int, ...]]] = []
+    result: list[tuple[str, frozenset[int] | tuple[int, ...]]] = []
     i = 0
     while i < len(w):
         matched = False
@@ -256,7 +258,7 @@ def _apply_grade2(word: str) -> list[tuple[str, tuple[int, ...]]]:
 # ---------------------------------------------------------------------------
 
 
-def _dots_to_cell(dots: tuple[int, ...]) -> list[str]:
+def _dots_to_cell(dots: frozenset[int] | tuple[int, ...]) -> list[str]:
     """Render a dot pattern as a 3-row ASCII-art Braille cell."""
     dot_set = set(dots)
     rows = []
@@ -267,6 +269,14 @@ def _dots_to_cell(dots: tuple[int, ...]) -> list[str]:
     return rows
 
 
+# Precomputed cells for every letter so encode_char is a single dict lookup
+# on the hot display path instead of rebuilding the rows each call.
+_CHAR_CELLS: dict[str, list[str]] = {
+    letter: _dots_to_cell(dots) for letter, dots in BRAILLE_PATTERNS.items()
+}
+_BLANK_CELL = ["   ", "   ", "   "]
+
+
 # ---------------------------------------------------------------------------
 # Public API (Grade 1, unchanged interface)
 # ---------------------------------------------------------------------------
@@ -280,13 +290,12 @@ def encode_char(char: str) -> list[str]:
 
     Returns:
         A list of 3 strings representing the 3 rows of the Braille cell.
+        The list is shared; callers must not mutate it.
     """
-    upper = char.upper()
-    if upper not in BRAILLE_PATTERNS:
-        return ["   ", "   ", "   "]
-    return _dots_to_cell(BRAILLE_PATTERNS[upper])
+    return _CHAR_CELLS.get(char.upper(), _BLANK_CELL)
 
 
+@functools.lru_cache(maxsize=256)
 def encode_word(word: str) -> list[list[str]]:
     """Encode a word to Braille ASCII art.
 
@@ -295,10 +304,17 @@ def encode_word(word: str) -> list[list[str]]:
 
     Returns:
         A list of character encodings, each being a list of 3 row strings.
+        Both the outer list and the inner cell lists are cached and shared
+        (repeated letters alias the same cell); callers must not mutate them.
     """
+    # Fast path: every character of a plain ASCII word has a cell, so the
+    # per-character membership filter can be skipped entirely.
+    if word.isascii() and word.isalpha():
+        return [_CHAR_CELLS[c] for c in word.upper()]
     return [encode_char(c) for c in word if c.upper() in BRAILLE_PATTERNS]
 
 
+@functools.lru_cache(maxsize=256)
 def get_display_lines(word: str, grade: int = 1) -> list[str]:
     """Get the display lines for a word in Braille.
 
@@ -308,6 +324,7 @@ def get_display_lines(word: str, grade: int = 1) -> list[str]:
 
     Returns:
         5 strings (3 rows with blank spacer lines between them).
+        The list is cached and shared across calls; treat it as read-only.
     """
     if grade == 2:
         return _get_display_lines_grade2(word)
@@ -317,13 +334,10 @@ def get_display_lines(word: str, grade: int = 1) -> list[str]:
     if not chars:
         return ["", "", "", "", ""]
 
-    lines = []
-    for row in range(3):
-        line = "   ".join(char[row] for char in chars)
-        lines.append(line)
-        if row < 2:
-            lines.append("")
-    return lines
+    # Transpose once and join each full row rather than scanning all cells
+    # per row with a generator.
+    top, mid, bot = ("   ".join(cells) for cells in zip(*chars))
+    return [top, "", mid, "", bot]
 
 
 # ---------------------------------------------------------------------------
@@ -338,9 +352,5 @@ def _get_display_lines_grade2(word: str) -> list[str]:
         return ["", "", "", "", ""]
 
     cells = [_dots_to_cell(dots) for _, dots in segments]
-    lines: list[str] = []
-    for row in range(3):
-        lines.append("   ".join(cell[row] for cell in cells))
-        if row < 2:
-            lines.append("")
-    return lines
+    top, mid, bot = ("   ".join(rows) for rows in zip(*cells))
+    return [top, "", mid, "", bot]
@@ -56,7 +56,7 @@ def get_default_progress_path() -> Path:
 MORSE_DISPLAY_MODES = ("both", "visual", "audio")
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Configuration settings for Borse.
 
@@ -3,6 +3,7 @@
 import contextlib
 import curses
 import random
+import textwrap
 from datetime import date, datetime, timezone
 
 from borse import braille, semaphore
@@ -37,6 +38,7 @@ class Game:
         self.progress = load_progress(self.config.progress_file)
         self.morse_player = MorsePlayer()
         self.session_start_time = datetime.now(timezone.utc).isoformat()
+        self._progress_dirty = False
 
         # Setup curses
         curses.curs_set(0)  # Hide cursor by default; shown during gameplay
@@ -47,7 +49,8 @@ class Game:
         curses.set_escdelay(25)
 
         # Initialize color pairs if available
-        if curses.has_colors():
+        self.has_colors = curses.has_colors()
+        if self.has_colors:
             curses.start_color()
             curses.init_pair(1, curses.COLOR_GREEN, -1)  # Correct / current session
             curses.init_pair(2, curses.COLOR_YELLOW, -1)  # Title
@@ -55,6 +58,41 @@ class Game:
             curses.init_pair(4, curses.COLOR_WHITE, -1)  # Gray (previous session)
             curses.init_pair(5, curses.COLOR_RED, -1)  # Abort dialog border
 
+        # Color support cannot change mid-session, so resolve the attribute
+        # used on the hot drawing paths once instead of per call.
+        self.attr_correct = curses.color_pair(1) if self.has_colors else curses.A_NORMAL
+
+    def _draw_input(self, row: int, col: int, user_input: str, word_lower: str) -> None:
+        """Draw the player's input in uppercase, coloring correct characters green.
+
+        Args:
+            row: Screen row of the input line.
+            col: Column where the input starts.
+            user_input: Characters typed so far.
+            word_lower: The target word being practiced, already lowercased.
+        """
+        upper = user_input.upper()
+        lower = user_input.lower()
+        green = self.attr_correct
+
+        def is_correct(i: int) -> bool:
+            return i < len(word_lower) and lower[i] == word_lower[i]
+
+        try:
+            # Draw runs of equally-colored characters in one addstr each
+            # instead of one call per character.
+            i = 0
+            while i < len(upper):
+                correct = is_correct(i)
+                j = i + 1
+                while j < len(upper) and is_correct(j) == correct:
+                    j += 1
+                attr = green if correct else curses.A_NORMAL
+                self.stdscr.addstr(row, col + i, upper[i:j], attr)
+                i = j
+        except curses.error:
+            pass
+
     def play_game(self, mode: GameMode) -> None:
         """Play a game session in the given mode.
 
@@ -65,7 +103,8 @@ class Game:
         mode_name = MODE_NAMES[mode]
         words_completed = 0
         total_words = self.config.words_per_game
-        completed_words: list[str] = []  # Track completed words
+        completed_words: list[str] = []  # Passed to the completion dialog
+        completed_str = ""  # Pre-joined uppercase form shown during play
         start_time = datetime.now(timezone.utc)
 
         # Build a deterministic seed so two players on the same day see the same words
@@ -91,6 +130,7 @@ class Game:
                 word = get_random_word_or_letter(
                     self.config.single_letter_probability, extra_glyphs, rng=rng
                 )
+                word_lower = word.lower()
                 user_input = ""
                 morse_mode = self.config.morse_display_mode
                 play_audio = mode == GameMode.MORSE and morse_mode in ("audio", "both")
@@ -100,7 +140,22 @@ class Game:
                 if play_audio:
                     self.morse_player.play(word, self.config.morse_volume)
 
+                # Encode the word once; redraws below just repaint these lines
+                display_lines: list[str] = []
+                if show_visual:
+                    if mode == GameMode.BRAILLE:
+                        display_lines = braille.get_display_lines(
+                            word, self.config.braille_grade
+                        )
+                    elif mode == GameMode.SEMAPHORE:
+                        display_lines = semaphore.get_display_lines(
+                            word, self.config.semaphore_compact
+                        )
+                    else:
+                        display_lines = display_func(word)
+
                 needs_full_redraw = True
+                needs_input_redraw = False
                 word_complete = False
                 timer_row = 3  # row returned by draw_title; updated on first draw
                 input_row = 0  # set during first full draw
@@ -121,16 +176,6 @@ class Game:
 
                         # Display the encoded word (or audio-only placeholder)
                         if show_visual:
-                            if mode == GameMode.BRAILLE:
-                                display_lines = braille.get_display_lines(
-                                    word, self.config.braille_grade
-                                )
-                            elif mode == GameMode.SEMAPHORE:
-                                display_lines = semaphore.get_display_lines(
-                                    word, self.config.semaphore_compact
-                                )
-                            else:
-                                display_lines = display_func(word)
                             for i, line in enumerate(display_lines):
                                 with contextlib.suppress(curses.error):
                                     self.stdscr.addstr(row + i, 4, line)
@@ -144,23 +189,9 @@ class Game:
 
                         # Input prompt - show user input in UPPERCASE
                         input_row = row
-                        try:
+                        with contextlib.suppress(curses.error):
                             self.stdscr.addstr(row, 2, "Type the word: ")
-                            display_input = user_input.upper()
-                            self.stdscr.addstr(row, input_start, display_input)
-
-                            # Show correct characters in green
-                            for i, char in enumerate(user_input):
-                                if i < len(word) and char.lower() == word[i].lower():
-                                    if curses.has_colors():
-                                        self.stdscr.attron(curses.color_pair(1))
-                                    self.stdscr.addstr(
-                                        row, input_start + i, char.upper()
-                                    )
-                                    if curses.has_colors():
-                                        self.stdscr.attroff(curses.color_pair(1))
-                        except curses.error:
-                            pass
+                        self._draw_input(row, input_start, user_input, word_lower)
 
                         row += 2
 
@@ -176,7 +207,7 @@ class Game:
                         row += 2
 
                         # Show completed words in green at the bottom
-                        if completed_words:
+                        if completed_str:
                             try:
                                 available_rows = height - row - 1
                                 if available_rows > 0:
@@ -185,41 +216,33 @@ class Game:
                                     col_start = 2
                                     line_width = _width - col_start - indent - 2
 
-                                    # Wrap words into lines that fit
-                                    lines: list[str] = []
-                                    current_line = ""
-                                    for cw in completed_words:
-                                        cw_upper = cw.upper()
-                                        entry = (
-                                            (", " + cw_upper)
-                                            if current_line
-                                            else cw_upper
-                                        )
-                                        if (
-                                            current_line
-                                            and len(current_line) + len(entry)
-                                            > line_width
-                                        ):
-                                            lines.append(current_line)
-                                            current_line = cw_upper
-                                        else:
-                                            current_line += entry
-                                    if current_line:
-                                        lines.append(current_line)
-
-                                    if curses.has_colors():
-                                        self.stdscr.attron(curses.color_pair(1))
+                                    # Wrap the pre-joined string into lines
+                                    lines = textwrap.wrap(
+                                        completed_str, max(line_width, 1)
+                                    )
+
+                                    if self.has_colors:
+                                        self.stdscr.attron(self.attr_correct)
                                     self.stdscr.addstr(row, col_start, prefix)
                                     for i, line in enumerate(lines[:available_rows]):
                                         self.stdscr.addstr(
                                             row + i, col_start + indent, line
                                         )
-                                    if curses.has_colors():
-                                        self.stdscr.attroff(curses.color_pair(1))
+                                    if self.has_colors:
+                                        self.stdscr.attroff(self.attr_correct)
                             except curses.error:
                                 pass
 
                         needs_full_redraw = False
+                        needs_input_redraw = False
+                    elif needs_input_redraw:
+                        # Only the typed input changed: clear and redraw that
+                        # one line instead of repainting the whole screen.
+                        with contextlib.suppress(curses.error):
+                            self.stdscr.move(input_row, input_start)
+                            self.stdscr.clrtoeol()
+                        self._draw_input(input_row, input_start, user_input, word_lower)
+                        needs_input_redraw = False
 
                     # Always overwrite the timer in place — no erase needed
                     with contextlib.suppress(curses.error):
@@ -229,7 +252,9 @@ class Game:
                     with contextlib.suppress(curses.error):
                         self.stdscr.move(input_row, input_start + len(user_input))
 
-                    self.stdscr.refresh()
+                    # Stage the frame and flush to the terminal in one update
+                    self.stdscr.noutrefresh()
+                    curses.doupdate()
 
                     if word_complete:
                         break
@@ -258,22 +283,28 @@ class Game:
                             )
                             self.progress.add_run(run)
                             if run.num_words > 0:
-                                save_progress(self.progress, self.config.progress_file)
+                                self._progress_dirty = True
                             return
                         needs_full_redraw = True
                     elif key == 9 and play_audio:  # Tab - replay audio
                         self.morse_player.replay()
                     elif key in (curses.KEY_BACKSPACE, 127, 8):
                         user_input = user_input[:-1]
-                        needs_full_redraw = True
+                        needs_input_redraw = True
                     elif 32 <= key <= 126:  # Printable characters
                         user_input += chr(key)
-                        needs_full_redraw = True
+                        needs_input_redraw = True
 
                         # Check if word matches
-                        if user_input.lower() == word.lower():
+                        if user_input.lower() == word_lower:
                             words_completed += 1
                             completed_words.append(word)
+                            word_upper = word.upper()
+                            completed_str = (
+                                f"{completed_str}, {word_upper}"
+                                if completed_str
+                                else word_upper
+                            )
                             word_complete = True
         finally:
             self.stdscr.timeout(-1)  # Restore blocking mode
@@ -296,7 +327,7 @@ class Game:
             else None,
         )
         self.progress.add_run(run)
-        save_progress(self.progress, self.config.progress_file)
+        self._progress_dirty = True
 
         duration = (end_time - start_time).total_seconds()
         show_completion(
@@ -307,18 +338,29 @@ class Game:
             duration,
         )
 
+    def _flush_progress(self) -> None:
+        """Write progress to disk if any runs were recorded since the last save."""
+        if self._progress_dirty:
+            save_progress(self.progress, self.config.progress_file)
+            self._progress_dirty = False
+
     def run(self) -> None:
         """Run the main game loop."""
-        while True:
-            result = show_menu(self.stdscr, self.config, self.progress)
-            if result is None:
-                break
-            elif isinstance(result, SettingsMode):
-                show_settings(self.stdscr, self.config)
-            elif isinstance(result, ShareMode):
-                show_share(self.stdscr, self.progress)
-            else:
-                self.play_game(result)
+        try:
+            while True:
+                result = show_menu(self.stdscr, self.config, self.progress)
+                if result is None:
+                    break
+                elif isinstance(result, SettingsMode):
+                    show_settings(self.stdscr, self.config)
+                elif isinstance(result, ShareMode):
+                    show_share(self.stdscr, self.progress)
+                else:
+                    self.play_game(result)
+                    self._flush_progress()
+        finally:
+            # Persist even when the loop exits via an exception (e.g. Ctrl-C)
+            self._flush_progress()
 
 
 def run_game(stdscr: curses.window) -> None:
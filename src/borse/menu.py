@@ -9,6 +9,45 @@ from borse.config import Config
 from borse.modes import MODE_SHORTCUTS, GameMode, SettingsMode, ShareMode
 from borse.progress import DailyProgress, Progress, format_duration
 
+# Static menu layout, precomputed once at import rather than per frame
+_MODES = list(GameMode)
+_MENU_ITEMS = [
+    "[B] Braille",
+    "[M] Morse code",
+    "[S] Semaphore",
+    "[A] A1Z26",
+    "[O] Options",
+    "[D] Daily share",
+    "[Q] Quit",
+]
+# Fixed column for "Last run" labels — aligned past the widest mode item
+_LAST_RUN_COL = 4 + max(len(f"  {item}  ") for item in _MENU_ITEMS[: len(_MODES)]) + 2
+
+# Layout of the today/all-time progress table
+_MODE_COLS = [
+    ("Braille", "braille_words"),
+    ("Morse", "morse_words"),
+    ("Semph", "semaphore_words"),
+    ("A1Z26", "a1z26_words"),
+]
+_COL_WIDTHS = [max(len(h), 4) for h, _ in _MODE_COLS]
+_COL_SEP = "  "
+_LABEL_W = 9  # len("All-time:")
+_TOTAL_W = 5
+_BAR = " | "
+_HEADER_LINE = " " * (_LABEL_W + 1 + _TOTAL_W + len(_BAR)) + _COL_SEP.join(
+    f"{h:>{w}}" for (h, _), w in zip(_MODE_COLS, _COL_WIDTHS)
+)
+_ROW_TEMPLATE = f"{{label:<{_LABEL_W}}} {{total:{_TOTAL_W}d}}{_BAR}" + _COL_SEP.join(
+    f"{{{attr}:{w}d}}" for (_, attr), w in zip(_MODE_COLS, _COL_WIDTHS)
+)
+
+
+def _format_stats_row(label: str, stats: DailyProgress) -> str:
+    """Format one row of the today/all-time progress table."""
+    values = {attr: getattr(stats, attr) for _, attr in _MODE_COLS}
+    return _ROW_TEMPLATE.format(label=label, total=stats.total_words, **values)
+
 
 def draw_title(stdscr: curses.window, title: str) -> int:
     """Clear the screen and draw a bold yellow title at the top.
@@ -48,59 +87,31 @@ def show_menu(
         Selected GameMode, SettingsMode.SETTINGS, or None to quit.
     """
     selected = 0
-    modes = list(GameMode)
-    menu_items = [
-        "[B] Braille",
-        "[M] Morse code",
-        "[S] Semaphore",
-        "[A] A1Z26",
-        "[O] Options",
-        "[D] Daily share",
-        "[Q] Quit",
-    ]
-    # Fixed column for "Last run" labels — aligned past the widest mode item
-    last_run_col = 4 + max(len(f"  {item}  ") for item in menu_items[: len(modes)]) + 2
+    modes = _MODES
+    menu_items = _MENU_ITEMS
+    last_run_col = _LAST_RUN_COL
+
+    # Progress only changes between menu invocations, so snapshot the
+    # aggregates once instead of rescanning every run on each keystroke.
+    today = progress.get_today()
+    alltime = progress.get_alltime_by_mode()
 
     while True:
+        today_str = date.today().isoformat()
         row = draw_title(stdscr, "BORSE - Braille mORse SEmaphore, by vEnhance")
         stdscr.addstr(row, 2, f"Version {__version__}")
         row += 2
         height, _ = stdscr.getmaxyx()
 
         # Show today's progress and all-time total as a 2×4 table
-        today = progress.get_today()
-        alltime = progress.get_alltime_by_mode()
-        mode_cols = [
-            ("Braille", "braille_words"),
-            ("Morse", "morse_words"),
-            ("Semph", "semaphore_words"),
-            ("A1Z26", "a1z26_words"),
-        ]
-        col_widths = [max(len(h), 4) for h, _ in mode_cols]
-        col_sep = "  "
-        label_w = 9  # len("All-time:")
-        total_w = 5
-        bar = " | "
-        header_indent = " " * (label_w + 1 + total_w + len(bar))
-        header_line = header_indent + col_sep.join(
-            f"{h:>{w}}" for (h, _), w in zip(mode_cols, col_widths)
-        )
-
-        def make_row(label: str, stats: DailyProgress) -> str:
-            cols = col_sep.join(
-                f"{getattr(stats, attr):{w}d}"
-                for (_, attr), w in zip(mode_cols, col_widths)
-            )
-            return f"{label:<{label_w}} {stats.total_words:{total_w}d}{bar}{cols}"
-
         try:
             if curses.has_colors():
                 stdscr.attron(curses.color_pair(3))
-            stdscr.addstr(row, 2, header_line)
+            stdscr.addstr(row, 2, _HEADER_LINE)
             row += 1
-            stdscr.addstr(row, 2, make_row("Today:", today))
+            stdscr.addstr(row, 2, _format_stats_row("Today:", today))
             row += 1
-            stdscr.addstr(row, 2, make_row("All-time:", alltime))
+            stdscr.addstr(row, 2, _format_stats_row("All-time:", alltime))
             if curses.has_colors():
                 stdscr.attroff(curses.color_pair(3))
         except curses.error:
@@ -127,7 +138,6 @@ def show_menu(
                     mode = modes[i]
                     last_run = progress.get_last_completed_run(mode.value)
                     if last_run is not None:
-                        today_str = date.today().isoformat()
                         run_date_str = last_run.date_str
                         is_today = run_date_str == today_str
                         if is_today:
@@ -155,7 +165,6 @@ def show_menu(
                 pass
 
         # Total time today (sum of all completed runs for today)
-        today_str = date.today().isoformat()
         today_secs = sum(
             r.duration_seconds()
             for r in progress.runs
@@ -199,9 +208,7 @@ def show_menu(
             return ShareMode.SHARE
         else:
             # Check for shortcut keys
-            try:
-                char = chr(key)
-                if char in MODE_SHORTCUTS:
-                    return MODE_SHORTCUTS[char]
-            except (ValueError, OverflowError):
-                pass
+            if 0 <= key < len(MODE_SHORTCUTS):
+                shortcut = MODE_SHORTCUTS[key]
+                if shortcut is not None:
+                    return shortcut
@@ -38,14 +38,15 @@ MODE_NAMES: dict[GameMode, str] = {
     GameMode.A1Z26: "A1Z26",
 }
 
-# Keyboard shortcuts for modes
-MODE_SHORTCUTS: dict[str, GameMode] = {
-    "b": GameMode.BRAILLE,
-    "B": GameMode.BRAILLE,
-    "m": GameMode.MORSE,
-    "M": GameMode.MORSE,
-    "s": GameMode.SEMAPHORE,
-    "S": GameMode.SEMAPHORE,
-    "a": GameMode.A1Z26,
-    "A": GameMode.A1Z26,
-}
+# Keyboard shortcuts for modes, indexed directly by curses keycode so the
+# menu loop can resolve a shortcut without chr()/dict hashing.
+MODE_SHORTCUTS: list[GameMode | None] = [None] * 128
+for _char, _mode in (
+    ("b", GameMode.BRAILLE),
+    ("m", GameMode.MORSE),
+    ("s", GameMode.SEMAPHORE),
+    ("a", GameMode.A1Z26),
+):
+    MODE_SHORTCUTS[ord(_char)] = _mode
+    MODE_SHORTCUTS[ord(_char.upper())] = _mode
+del _char, _mode
@@ -1,49 +1,74 @@
 """Morse code encoding module."""
 
-# Morse code mapping for letters and numbers
-MORSE_CODE: dict[str, str] = {
-    "A": ".-",
-    "B": "-...",
-    "C": "-.-.",
-    "D": "-..",
-    "E": ".",
-    "F": "..-.",
-    "G": "--.",
-    "H": "....",
-    "I": "..",
-    "J": ".---",
-    "K": "-.-",
-    "L": ".-..",
-    "M": "--",
-    "N": "-.",
-    "O": "---",
-    "P": ".--.",
-    "Q": "--.-",
-    "R": ".-.",
-    "S": "...",
-    "T": "-",
-    "U": "..-",
-    "V": "...-",
-    "W": ".--",
-    "X": "-..-",
-    "Y": "-.--",
-    "Z": "--..",
-    "0": "-----",
-    "1": ".----",
-    "2": "..---",
-    "3": "...--",
-    "4": "....-",
-    "5": ".....",
-    "6": "-....",
-    "7": "--...",
-    "8": "---..",
-    "9": "----.",
-}
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Morse code mapping for letters and numbers (read-only)
+MORSE_CODE: Mapping[str, str] = MappingProxyType(
+    {
+        "A": ".-",
+        "B": "-...",
+        "C": "-.-.",
+        "D": "-..",
+        "E": ".",
+        "F": "..-.",
+        "G": "--.",
+        "H": "....",
+        "I": "..",
+        "J": ".---",
+        "K": "-.-",
+        "L": ".-..",
+        "M": "--",
+        "N": "-.",
+        "O": "---",
+        "P": ".--.",
+        "Q": "--.-",
+        "R": ".-.",
+        "S": "...",
+        "T": "-",
+        "U": "..-",
+        "V": "...-",
+        "W": ".--",
+        "X": "-..-",
+        "Y": "-.--",
+        "Z": "--..",
+        "0": "-----",
+        "1": ".----",
+        "2": "..---",
+        "3": "...--",
+        "4": "....-",
+        "5": ".....",
+        "6": "-....",
+        "7": "--...",
+        "8": "---..",
+        "9": "----.",
+    }
+)
 
 # Use Unicode dot and dash for nicer display
 DOT = "●"
 DASH = "━"
 
+# Substitution table mapping each code symbol to its display glyph plus the
+# intra-letter spacing, applied in one C-level translate pass per character.
+_SYMBOL_TABLE = str.maketrans({".": f"{DOT} ", "-": f"{DASH} "})
+
+# Final display string for each character, built once at import.  Both cases
+# are stored as keys so encode_char needs neither .upper() nor a fallback.
+_MORSE_DISPLAY: dict[str, str] = {}
+for _k, _v in MORSE_CODE.items():
+    _disp = _v.translate(_SYMBOL_TABLE).rstrip()
+    _MORSE_DISPLAY[_k] = _MORSE_DISPLAY[_k.lower()] = _disp
+del _k, _v, _disp
+
+
+# Deletion table that strips every ASCII character lacking a Morse code in
+# a single C-level pass, used to pre-filter words in encode_word.
+_NON_MORSE_ASCII = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if chr(i) not in _MORSE_DISPLAY)
+)
+
 
 def encode_char(char: str) -> str:
     """Encode a single character to Morse code.
@@ -54,15 +79,10 @@ def encode_char(char: str) -> str:
     Returns:
         The Morse code representation using ● for dot and ━ for dash.
     """
-    upper = char.upper()
-    if upper not in MORSE_CODE:
-        return ""
-    morse = MORSE_CODE[upper]
-    # Add space between each dot/dash within the letter
-    symbols = [DOT if c == "." else DASH for c in morse]
-    return " ".join(symbols)
+    return _MORSE_DISPLAY.get(char, "")
 
 
+@functools.lru_cache(maxsize=256)
 def encode_word(word: str) -> str:
     """Encode a word to Morse code.
 
@@ -72,9 +92,16 @@ def encode_word(word: str) -> str:
     Returns:
         The Morse code representation with spaces between letters.
     """
-    return "     ".join(encode_char(c) for c in word if c.upper() in MORSE_CODE)
+    if word.isascii():
+        # Strip unencodable characters in one translate pass, leaving an
+        # unconditional table lookup per remaining character.
+        return "     ".join(
+            [_MORSE_DISPLAY[c] for c in word.translate(_NON_MORSE_ASCII)]
+        )
+    return "     ".join(d for c in word if (d := _MORSE_DISPLAY.get(c)))
 
 
+@functools.lru_cache(maxsize=256)
 def get_display_lines(word: str) -> list[str]:
     """Get the display lines for a word in Morse code.
 
@@ -83,5 +110,6 @@ def get_display_lines(word: str) -> list[str]:
 
     Returns:
         A list containing a single line with the Morse code.
+        The list is cached across calls; callers must not mutate it.
     """
     return [encode_word(word)]
@@ -1,5 +1,9 @@
 """Flag semaphore encoding module with ASCII art display."""
 
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+
 # Flag positions (like clock positions):
 # 0 = down (6 o'clock)
 # 1 = down-left (about 7:30)
@@ -11,35 +15,37 @@
 # 7 = down-right (about 4:30)
 
 # Semaphore positions for each letter: (left_flag, right_flag)
-# Positions are numbered 0-7 going clockwise from down
-SEMAPHORE_POSITIONS: dict[str, tuple[int, int]] = {
-    "A": (0, 1),
-    "B": (0, 2),
-    "C": (0, 3),
-    "D": (0, 4),
-    "E": (0, 5),
-    "F": (0, 6),
-    "G": (0, 7),
-    "H": (1, 2),
-    "I": (1, 3),
-    "J": (4, 6),
-    "K": (1, 4),
-    "L": (1, 5),
-    "M": (1, 6),
-    "N": (1, 7),
-    "O": (2, 3),
-    "P": (2, 4),
-    "Q": (2, 5),
-    "R": (2, 6),
-    "S": (2, 7),
-    "T": (3, 4),
-    "U": (3, 5),
-    "V": (4, 7),
-    "W": (5, 6),
-    "X": (5, 7),
-    "Y": (3, 6),
-    "Z": (6, 7),
-}
+# Positions are numbered 0-7 going clockwise from down (read-only)
+SEMAPHORE_POSITIONS: Mapping[str, tuple[int, int]] = MappingProxyType(
+    {
+        "A": (0, 1),
+        "B": (0, 2),
+        "C": (0, 3),
+        "D": (0, 4),
+        "E": (0, 5),
+        "F": (0, 6),
+        "G": (0, 7),
+        "H": (1, 2),
+        "I": (1, 3),
+        "J": (4, 6),
+        "K": (1, 4),
+        "L": (1, 5),
+        "M": (1, 6),
+        "N": (1, 7),
+        "O": (2, 3),
+        "P": (2, 4),
+        "Q": (2, 5),
+        "R": (2, 6),
+        "S": (2, 7),
+        "T": (3, 4),
+        "U": (3, 5),
+        "V": (4, 7),
+        "W": (5, 6),
+        "X": (5, 7),
+        "Y": (3, 6),
+        "Z": (6, 7),
+    }
+)
 
 # Grid is 7x5 (wider for horizontal arms):
 #   0  1  2  3  4  5  6
@@ -49,77 +55,84 @@ SEMAPHORE_POSITIONS: dict[str, tuple[int, int]] = {
 #  28 29 30 31 32 33 34
 # Position 17 is center (the person)
 
-# Grid positions for each flag position
+# Grid positions for each flag position, indexed by position number
 # Most positions have 2 cells (inner, outer)
 # Horizontal positions (2, 6) have 3 cells for longer arms
-POSITION_TO_GRID: dict[int, tuple[int, ...]] = {
-    0: (24, 31),  # down
-    1: (23, 29),  # down-left
-    2: (16, 15, 14),  # out-left (3 hyphens)
-    3: (9, 1),  # up-left
-    4: (10, 3),  # up
-    5: (11, 5),  # up-right
-    6: (18, 19, 20),  # out-right (3 hyphens)
-    7: (25, 33),  # down-right
-}
-
-# Characters to show for each flag position
+POSITION_TO_GRID: tuple[tuple[int, ...], ...] = (
+    (24, 31),  # 0: down
+    (23, 29),  # 1: down-left
+    (16, 15, 14),  # 2: out-left (3 hyphens)
+    (9, 1),  # 3: up-left
+    (10, 3),  # 4: up
+    (11, 5),  # 5: up-right
+    (18, 19, 20),  # 6: out-right (3 hyphens)
+    (25, 33),  # 7: down-right
+)
+
+# Characters to show for each flag position, indexed by position number
 # Based on the direction from center
-POSITION_CHARS: dict[int, str] = {
-    0: "|",  # down
-    1: "/",  # down-left
-    2: "-",  # out-left
-    3: "\\",  # up-left
-    4: "|",  # up
-    5: "/",  # up-right
-    6: "-",  # out-right
-    7: "\\",  # down-right
-}
-
-
-def encode_char(char: str) -> list[str]:
-    """Encode a single character to semaphore ASCII art.
-
-    Args:
-        char: A single character to encode.
-
-    Returns:
-        A list of 5 strings representing the 5 rows of the semaphore display.
-    """
-    upper = char.upper()
-    if upper not in SEMAPHORE_POSITIONS:
-        return ["       ", "       ", "       ", "       ", "       "]
-
-    left_pos, right_pos = SEMAPHORE_POSITIONS[upper]
-
-    # Build the 7x5 grid
-    grid = [" "] * 35
-    grid[17] = "O"  # Person in center
+POSITION_CHARS: tuple[str, ...] = (
+    "|",  # 0: down
+    "/",  # 1: down-left
+    "-",  # 2: out-left
+    "\\",  # 3: up-left
+    "|",  # 4: up
+    "/",  # 5: up-right
+    "-",  # 6: out-right
+    "\\",  # 7: down-right
+)
+
+
+def _build_rows(letter: str) -> list[str]:
+    """Render the 7x5 grid rows for one letter (run once per letter at import)."""
+    left_pos, right_pos = SEMAPHORE_POSITIONS[letter]
+
+    # Build the 7x5 grid as a dense ASCII byte buffer
+    grid = bytearray(b" " * 35)
+    grid[17] = ord("O")  # Person in center
 
     # Place the flags (variable length based on position)
     left_cells = POSITION_TO_GRID[left_pos]
     right_cells = POSITION_TO_GRID[right_pos]
 
-    left_char = POSITION_CHARS[left_pos]
-    right_char = POSITION_CHARS[right_pos]
+    left_char = ord(POSITION_CHARS[left_pos])
+    right_char = ord(POSITION_CHARS[right_pos])
 
     for cell in left_cells:
         grid[cell] = left_char
     for cell in right_cells:
         grid[cell] = right_char
 
-    # Convert to 5 rows (7 columns each)
-    rows = [
-        "".join(grid[0:7]),
-        "".join(grid[7:14]),
-        "".join(grid[14:21]),
-        "".join(grid[21:28]),
-        "".join(grid[28:35]),
-    ]
+    # Convert to 5 rows (7 columns each): decode the buffer once and
+    # split at the fixed row offsets.
+    flat = grid.decode("ascii")
+    return [flat[0:7], flat[7:14], flat[14:21], flat[21:28], flat[28:35]]
+
+
+# Precomputed rows for every letter so encode_char is a single dict lookup
+# instead of a fresh 35-cell grid fill per call.  Both cases are stored as
+# keys so no case folding is needed on lookup.
+_CHAR_ROWS: dict[str, list[str]] = {}
+for _letter in SEMAPHORE_POSITIONS:
+    _CHAR_ROWS[_letter] = _CHAR_ROWS[_letter.lower()] = _build_rows(_letter)
+del _letter
+_BLANK_ROWS = ["       "] * 5
+
+
+def encode_char(char: str) -> list[str]:
+    """Encode a single character to semaphore ASCII art.
 
-    return rows
+    Args:
+        char: A single character to encode.
+
+    Returns:
+        A list of 5 strings representing the 5 rows of the semaphore display.
+        The list is shared; callers must not mutate it.
+    """
+    return _CHAR_ROWS.get(char, _BLANK_ROWS)
 
 
+@functools.lru_cache(maxsize=256)
 def encode_word(word: str) -> list[list[str]]:
     """Encode a word to semaphore ASCII art.
 
@@ -128,8 +141,10 @@ def encode_word(word: str) -> list[list[str]]:
 
     Returns:
         A list of character encodings, each being a list of 5 row strings.
+        Both the outer list and the per-character row lists are cached and
+        shared; callers must not mutate them.
     """
-    return [encode_char(c) for c in word if c.upper() in SEMAPHORE_POSITIONS]
+    return [rows for c in word if (rows := _CHAR_ROWS.get(c))]
 
 
 def _trim_char(rows: list[str]) -> list[str]:
@@ -145,6 +160,7 @@ def _trim_char(rows: list[str]) -> list[str]:
     return [row[min_col : max_col + 1] for row in rows]
 
 
+@functools.lru_cache(maxsize=256)
 def get_display_lines(word: str, compact: bool = False) -> list[str]:
     """Get the display lines for a word in semaphore.
 
@@ -153,7 +169,9 @@ def get_display_lines(word: str, compact: bool = False) -> list[str]:
         compact: If True, trim unused horizontal space from each glyph.
 
     Returns:
-        A list of 5 strings, one for each row, with characters separated by spaces.
+        A list of 5 strings, one for each row, with characters separated by
+        spaces.  The list is cached and shared across calls; treat it as
+        read-only.
     """
     chars = encode_word(word)
     if not chars:
@@ -162,6 +180,7 @@ def get_display_lines(word: str, compact: bool = False) -> list[str]:
     if compact:
         chars = [_trim_char(c) for c in chars]
 
+    # Transpose the per-character grids once and let str.join assemble each
+    # row in a single C-level pass.
     sep = " " if compact else "  "
-    lines = [sep.join(char[row] for char in chars) for row in range(5)]
-    return lines
+    return [sep.join(rows) for rows in zip(*chars)]
@@ -1,5 +1,6 @@
 """Word list for the game."""
 
+import functools
 import random
 import string
 from pathlib import Path
@@ -7,9 +8,31 @@ from pathlib import Path
 LETTERS = string.ascii_lowercase
 PATH_TO_WORDS = Path(__file__).with_name("WORDS.txt")
 
+# Bound method of the module-level RNG, saving an attribute lookup per draw
+# on the common unseeded path.
+_choice = random.choice
 
-with open(PATH_TO_WORDS) as f:
-    COMMON_WORDS = [line.strip() for line in f]
+
+@functools.cache
+def _load_common_words() -> tuple[str, ...]:
+    """Read WORDS.txt once, on first use."""
+    return tuple(PATH_TO_WORDS.read_text().splitlines())
+
+
+@functools.cache
+def _common_words_set() -> frozenset[str]:
+    """Hashed mirror of the word list for O(1) membership checks."""
+    return frozenset(_load_common_words())
+
+
+def __getattr__(name: str) -> tuple[str, ...] | frozenset[str]:
+    # Lazy module attributes (PEP 562): importing borse.words no longer pays
+    # for the file read; the collections materialize on first access.
+    if name == "COMMON_WORDS":
+        return _load_common_words()
+    if name == "COMMON_WORDS_SET":
+        return _common_words_set()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_random_word(rng: random.Random | None = None) -> str:
@@ -18,8 +41,8 @@ def get_random_word(rng: random.Random | None = None) -> str:
     Returns:
         A random common English word.
     """
-    r = rng or random
-    return r.choice(COMMON_WORDS)
+    choice = rng.choice if rng is not None else _choice
+    return choice(_load_common_words())
 
 
 def get_random_letter(rng: random.Random | None = None) -> str:
@@ -28,8 +51,8 @@ def get_random_letter(rng: random.Random | None = None) -> str:
     Returns:
         A random lowercase letter.
     """
-    r = rng or random
-    return r.choice(LETTERS)
+    choice = rng.choice if rng is not None else _choice
+    return choice(LETTERS)
 
 
 def get_random_word_or_letter(
@@ -49,9 +72,15 @@ def get_random_word_or_letter(
         A random word or a glyph from the single-glyph pool.
     """
     r = rng or random
-    if r.random() < single_letter_probability:
-        pool: list[str] = list(LETTERS)
-        if extra_glyphs:
-            pool = pool + extra_glyphs
+    # Degenerate probabilities skip the RNG draw on the unseeded path; with a
+    # seeded rng the draw is kept so recorded sequences stay reproducible.
+    if rng is None and not 0.0 < single_letter_probability < 1.0:
+        take_glyph = single_letter_probability >= 1.0
+    else:
+        take_glyph = r.random() < single_letter_probability
+    if take_glyph:
+        # choice over the letters string draws identically to a list of the
+        # same 26 letters, so the pool list is only built for extra glyphs.
+        pool = list(LETTERS) + extra_glyphs if extra_glyphs else LETTERS
         return r.choice(pool)
     return get_random_word(rng=rng)